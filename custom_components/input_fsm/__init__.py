@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections import Counter
 from typing import Any, Dict, List
 
 import voluptuous as vol
@@ -8,7 +10,6 @@ from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.entity_component import EntityComponent
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.reload import async_integration_yaml_config
 
 from .const import (
     DOMAIN,
@@ -68,24 +69,42 @@ CONFIG_SCHEMA = vol.Schema(
 )
 
 
+def _object_hashes(section: Any) -> Dict[Any, bytes]:
+    """Fingerprint each raw FSM definition so unchanged ones can be skipped on reload."""
+    if not isinstance(section, dict):
+        return {}
+    # repr() works on any YAML-loaded value and, unlike JSON, keeps keys like True, 1 and "1" apart.
+    return {oid: hashlib.blake2b(repr(c).encode()).digest() for oid, c in section.items()}
+
+
+def _register(store: Dict[str, Any], ent: FSMEntity) -> None:
+    store["entities_by_id"][ent.entity_id] = ent
+    store["entities_by_object_id"][ent._object_id] = ent
+
+
+def _unregister(store: Dict[str, Any], object_id: str) -> FSMEntity | None:
+    ent = store["entities_by_object_id"].pop(object_id, None)
+    if ent is not None:
+        store["entities_by_id"].pop(ent.entity_id, None)
+    return ent
+
+
 def _state_names(states: List[Dict[str, Any]]) -> set:
     return {s.get("name") for s in states}
 
 
-def _log_transition_issues(object_id: str, states: List[Dict[str, Any]], transitions: List[Dict[str, Any]]) -> None:
-    names = _state_names(states)
-    seen = set()
-    for t in transitions:
-        pair = (t["source"], t["trigger"])
-        if pair in seen:
-            _LOGGER.warning("input_fsm: duplicate transition for (%s, %s) in %s", t["source"], t["trigger"], object_id)
-        else:
-            seen.add(pair)
-        # Allow wildcard source; only validate dest
-        if t["source"] != WILDCARD and t["source"] not in names:
-            _LOGGER.error("input_fsm: transition %s has invalid source in %s", t, object_id)
-        if t["dest"] not in names:
-            _LOGGER.error("input_fsm: transition %s has invalid dest in %s", t, object_id)
+def _log_transition_issues(object_id: str, names: set, transitions: List[Dict[str, Any]]) -> None:
+    pairs = Counter((t["source"], t["trigger"]) for t in transitions)
+    for (source, trigger), count in pairs.items():
+        if count > 1:
+            _LOGGER.warning("input_fsm: duplicate transition for (%s, %s) in %s", source, trigger, object_id)
+    # Allow wildcard source; only validate dest
+    bad_sources = {t["source"] for t in transitions} - names - {WILDCARD}
+    if bad_sources:
+        _LOGGER.error("input_fsm: transitions with invalid source %s in %s", sorted(bad_sources), object_id)
+    bad_dests = {t["dest"] for t in transitions} - names
+    if bad_dests:
+        _LOGGER.error("input_fsm: transitions with invalid dest %s in %s", sorted(bad_dests), object_id)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
@@ -97,6 +116,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     store["component"] = component
 
     # Validate initial config
+    object_hashes = _object_hashes(config.get(DOMAIN))
     try:
         cfg = CONFIG_SCHEMA(config)
     except vol.Invalid as e:
@@ -104,6 +124,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         return False
 
     fsm_configs: Dict[str, Dict[str, Any]] = cfg.get(DOMAIN, {}) or {}
+    store["object_hashes"] = object_hashes
     entities: List[FSMEntity] = []
 
     for object_id, c in fsm_configs.items():
@@ -113,7 +134,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         names = _state_names(states)
         if initial not in names:
             _LOGGER.warning("input_fsm: initial state '%s' for %s not in declared states %s", initial, object_id, names)
-        _log_transition_issues(object_id, states, transitions)
+        _log_transition_issues(object_id, names, transitions)
         ent = FSMEntity(hass, object_id, initial, states, transitions)
         entities.append(ent)
 
@@ -121,47 +142,50 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     for ent in entities:
         if hasattr(ent, "entity_id"):
-            store["entities_by_id"][ent.entity_id] = ent
-            store["entities_by_object_id"][ent._object_id] = ent
+            _register(store, ent)
             _LOGGER.debug("input_fsm registered entity_id %s", ent.entity_id)
 
     # ----- Services -----
+    entities_by_id: Dict[str, FSMEntity] = store["entities_by_id"]
+
+    def _resolve_entity(call: ServiceCall, *required_keys: str) -> tuple[FSMEntity | None, List[Any] | None]:
+        """Return (entity, values of required_keys), or (None, None) after logging the problem."""
+        data = call.data
+        entity_id = data.get("entity_id")
+        values = [data.get(k) for k in required_keys]
+        if required_keys and (not entity_id or not all(values)):
+            _LOGGER.error("input_fsm.%s requires entity_id and %s", call.service, " and ".join(required_keys))
+            return None, None
+        ent = entities_by_id.get(entity_id)
+        if ent is None:
+            _LOGGER.error("input_fsm: entity %s not found", entity_id)
+            return None, None
+        return ent, values
+
     async def svc_trigger(call: ServiceCall):
-        entity_id = call.data.get("entity_id")
-        trigger = call.data.get("trigger")
-        if not entity_id or not trigger:
-            _LOGGER.error("input_fsm.trigger requires entity_id and trigger")
-            return
-        ent: FSMEntity | None = store["entities_by_id"].get(entity_id)
+        ent, values = _resolve_entity(call, "trigger")
         if ent:
-            await ent.async_trigger(trigger)
-        else:
-            _LOGGER.error("input_fsm: entity %s not found", entity_id)
+            await ent.async_trigger(values[0])
 
     async def svc_set_state(call: ServiceCall):
-        entity_id = call.data.get("entity_id")
-        state = call.data.get("state")
-        if not entity_id or not state:
-            _LOGGER.error("input_fsm.set_state requires entity_id and state")
-            return
-        ent: FSMEntity | None = store["entities_by_id"].get(entity_id)
-        if ent:
-            ok = await ent.async_set_state(state)
-            if not ok:
-                _LOGGER.error("input_fsm.set_state: invalid state '%s' for %s", state, entity_id)
-        else:
-            _LOGGER.error("input_fsm: entity %s not found", entity_id)
+        ent, values = _resolve_entity(call, "state")
+        if ent and not await ent.async_set_state(values[0]):
+            _LOGGER.error("input_fsm.set_state: invalid state '%s' for %s", values[0], ent.entity_id)
 
     async def svc_reset(call: ServiceCall):
-        entity_id = call.data.get("entity_id")
-        ent: FSMEntity | None = store["entities_by_id"].get(entity_id)
+        ent, _ = _resolve_entity(call)
         if ent:
             await ent.async_reset()
-        else:
-            _LOGGER.error("input_fsm: entity %s not found", entity_id)
 
     async def svc_reload(call: ServiceCall):
+        from homeassistant.helpers.reload import async_integration_yaml_config
+
         raw_section = await async_integration_yaml_config(hass, DOMAIN) or {}
+        new_hashes = _object_hashes(raw_section)
+        old_hashes: Dict[Any, bytes] = store.get("object_hashes", {})
+        if new_hashes == old_hashes:
+            _LOGGER.info("input_fsm.reload: configuration unchanged; nothing to do")
+            return
         try:
             validated = CONFIG_SCHEMA({DOMAIN: raw_section})
         except vol.Invalid as e:
@@ -169,9 +193,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             return
 
         new_cfg: Dict[str, Dict[str, Any]] = validated.get(DOMAIN, {}) or {}
+        store["object_hashes"] = new_hashes
+
         old_by_object = store["entities_by_object_id"]
-        new_object_ids = set(new_cfg.keys())
-        old_object_ids = set(old_by_object.keys())
+        new_object_ids = set(new_cfg)
+        old_object_ids = set(old_by_object)
 
         to_add = new_object_ids - old_object_ids
         to_update = new_object_ids & old_object_ids
@@ -181,11 +207,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
         # Remove
         for oid in to_remove:
-            ent = old_by_object.get(oid)
+            ent = _unregister(store, oid)
             if ent:
                 await ent.async_remove()
-                store["entities_by_id"].pop(ent.entity_id, None)
-                old_by_object.pop(oid, None)
                 _LOGGER.info("input_fsm.reload: removed %s (%s)", oid, ent.entity_id)
 
         # Add
@@ -195,19 +219,21 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             initial = c.get("initial")
             states = c.get("states", [])
             transitions = c.get("transitions", [])
-            _log_transition_issues(oid, states, transitions)
+            _log_transition_issues(oid, _state_names(states), transitions)
             ent = FSMEntity(hass, oid, initial, states, transitions)
             new_entities.append(ent)
 
         if new_entities:
             await store["component"].async_add_entities(new_entities)
             for ent in new_entities:
-                store["entities_by_id"][ent.entity_id] = ent
-                store["entities_by_object_id"][ent._object_id] = ent
+                _register(store, ent)
                 _LOGGER.info("input_fsm.reload: added %s (%s)", ent._object_id, ent.entity_id)
 
         # Update
         for oid in to_update:
+            if oid in new_hashes and old_hashes.get(oid) == new_hashes[oid]:
+                _LOGGER.debug("input_fsm.reload: %s unchanged", oid)
+                continue
             ent = old_by_object.get(oid)
             if ent:
                 await ent.async_apply_config(new_cfg[oid])
@@ -1,14 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
-import uuid
-from typing import Any, Dict, List, Optional
+from collections import deque, namedtuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.restore_state import RestoreEntity
-from homeassistant.helpers.template import Template
-from homeassistant.helpers.event import async_call_later
 
 from .const import (
     EVENT_TRANSITION_FAILED,
@@ -17,12 +16,47 @@ from .const import (
     WILDCARD,
 )
 
+if TYPE_CHECKING:
+    from homeassistant.helpers.template import Template
+
 _LOGGER = logging.getLogger(__name__)
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+RecentTxn = namedtuple("RecentTxn", ["transition_id", "trigger", "from_", "to"])
+
+
+def _recent_as_dict(txn: RecentTxn) -> Dict[str, Any]:
+    d = {"trigger": txn.trigger, "from": txn.from_, "to": txn.to}
+    if txn.transition_id is not None:
+        d["transition_id"] = txn.transition_id
+    return d
+
 
 class FSMEntity(RestoreEntity):
     _attr_icon = "mdi:state-machine"
 
+    # Entity itself keeps a __dict__, but our own attributes go into compact slots.
+    __slots__ = (
+        "_object_id",
+        "_initial",
+        "_state",
+        "_transitions",
+        "_state_definitions",
+        "_state_lookup",
+        "_transition_index",
+        "_wildcard_index",
+        "_triggers_by_state",
+        "_wildcard_triggers_sorted",
+        "_state_names_list",
+        "_transitions_summary",
+        "_guard_templates",
+        "_lock",
+        "_timeout_unsub",
+        "_txn_counter",
+        "_recent",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -39,10 +73,19 @@ class FSMEntity(RestoreEntity):
         self._transitions = transitions or []
         self._state_definitions = states or []
         self._state_lookup = {s.get("name"): s for s in self._state_definitions}
+        self._transition_index: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._wildcard_index: Dict[str, Dict[str, Any]] = {}
+        self._triggers_by_state: Dict[str, List[str]] = {}
+        self._wildcard_triggers_sorted: List[str] = []
+        self._state_names_list: List[str] = []
+        self._transitions_summary: List[Dict[str, Any]] = []
+        self._guard_templates: Dict[str, Template] = {}
+        self._build_index()
 
         self._lock = asyncio.Lock()
         self._timeout_unsub = None
-        self._recent = []  # ring buffer of last transitions
+        self._txn_counter = itertools.count()
+        self._recent: deque = deque(maxlen=10)  # ring buffer of last transitions
 
     @property
     def unique_id(self) -> str:
@@ -59,19 +102,12 @@ class FSMEntity(RestoreEntity):
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         meta = self._state_lookup.get(self._state, {}) if self._state is not None else {}
-        current_triggers = sorted(
-            {
-                t.get("trigger")
-                for t in self._transitions
-                if t.get("source") == self._state or t.get("source") == WILDCARD
-            }
-        )
         return {
             "current_state_description": meta.get("description", ""),
-            "available_states": [s.get("name") for s in self._state_definitions],
-            "available_triggers": current_triggers,
-            "available_transitions": self._transitions,
-            "recent_transitions": self._recent[-10:],
+            "available_states": self._state_names_list,
+            "available_triggers": self._triggers_by_state.get(self._state, self._wildcard_triggers_sorted),
+            "available_transitions": self._transitions_summary,
+            "recent_transitions": [_recent_as_dict(txn) for txn in self._recent],
         }
 
     async def async_added_to_hass(self) -> None:
@@ -90,6 +126,7 @@ class FSMEntity(RestoreEntity):
             self._state_definitions = cfg.get("states", self._state_definitions) or []
             self._state_lookup = {s.get("name"): s for s in self._state_definitions}
             self._transitions = cfg.get("transitions", self._transitions) or []
+            self._build_index()
 
             if old_state not in self._state_lookup:
                 _LOGGER.warning("FSM %s: current state '%s' not in new config; resetting to initial '%s'",
@@ -100,15 +137,59 @@ class FSMEntity(RestoreEntity):
             _LOGGER.info("FSM %s: config applied (states=%d, transitions=%d)",
                          self.entity_id, len(self._state_definitions), len(self._transitions))
 
+    def _build_index(self) -> None:
+        # The first matching transition in YAML order wins: later duplicates never overwrite
+        # earlier ones, and a wildcard row shadows any specific row for its trigger listed after it.
+        self._transition_index = {}
+        self._wildcard_index = {}
+        per_state: Dict[str, set] = {}
+        for t in self._transitions:
+            # Make every optional field present so the trigger path can index directly.
+            t.setdefault("guard", None)
+            t.setdefault("timeout", None)
+            t.setdefault("actions", [])
+            t["_actions"] = self._prepare_actions(t["actions"])
+            src = t["source"]
+            trigger = t["trigger"]
+            if src == WILDCARD:
+                self._wildcard_index.setdefault(trigger, t)
+            else:
+                per_state.setdefault(src, set()).add(trigger)
+                if trigger not in self._wildcard_index:
+                    self._transition_index.setdefault((src, trigger), t)
+
+        # Attribute reads are frequent, so the trigger lists per state are sorted here once.
+        wildcard_triggers = set(self._wildcard_index)
+        self._wildcard_triggers_sorted = sorted(wildcard_triggers)
+        self._state_names_list = [s.get("name") for s in self._state_definitions]
+        self._transitions_summary = [
+            {"trigger": t["trigger"], "source": t["source"], "dest": t["dest"]}
+            for t in self._transitions
+        ]
+        self._triggers_by_state = {
+            name: sorted(per_state.get(name, set()) | wildcard_triggers)
+            for name in set(self._state_names_list) | set(per_state)
+        }
+
+        # Guard templates are compiled on first use (see _eval_guard) and memoized per expression.
+        self._guard_templates = {}
+
+    def _prepare_actions(self, actions: Optional[List[Dict[str, Any]]]) -> List[Tuple[str, str, str, Dict[str, Any]]]:
+        """Split action services into (service, domain, name, data) once, dropping malformed ones."""
+        prepared = []
+        for act in actions or []:
+            svc = act.get("service")
+            if not svc or "." not in svc:
+                _LOGGER.error("FSM %s: bad action service '%s'; action ignored", self._object_id, svc)
+                continue
+            domain, service = svc.split(".", 1)
+            prepared.append((svc, domain, service, act.get("data", {})))
+        return prepared
+
     async def async_trigger(self, trigger: str) -> bool:
         async with self._lock:
-            transition_id = str(uuid.uuid4())
-            matching = None
-            for t in self._transitions:
-                src = t.get("source")
-                if t.get("trigger") == trigger and (src == self._state or src == WILDCARD):
-                    matching = t
-                    break
+            transition_id = f"{self._object_id}:{next(self._txn_counter)}"
+            matching = self._transition_index.get((self._state, trigger)) or self._wildcard_index.get(trigger)
 
             if not matching:
                 self._fire_event(EVENT_TRANSITION_FAILED, {
@@ -121,7 +202,7 @@ class FSMEntity(RestoreEntity):
                               self.entity_id, trigger, self._state)
                 return False
 
-            guard_expr = matching.get("guard")
+            guard_expr = matching["guard"]
             guard_value = None
             if guard_expr is not None:
                 guard_value = await self._eval_guard(guard_expr)
@@ -137,9 +218,9 @@ class FSMEntity(RestoreEntity):
                                   self.entity_id, trigger, guard_expr)
                     return False
 
-            dest = matching.get("dest")
-            timeout_cfg = matching.get("timeout")
-            actions = matching.get("actions", [])
+            dest = matching["dest"]
+            timeout_cfg = matching["timeout"]
+            actions = matching["_actions"]
 
             self._fire_event(EVENT_TRANSITION_STARTED, {
                 "transition_id": transition_id,
@@ -151,7 +232,8 @@ class FSMEntity(RestoreEntity):
 
             prev = self._state
             self._state = dest
-            self.async_write_ha_state()
+            if dest != prev:
+                self.async_write_ha_state()
 
             self._cancel_timeout()
             if isinstance(timeout_cfg, dict):
@@ -162,7 +244,7 @@ class FSMEntity(RestoreEntity):
 
             actions_status = await self._run_actions(actions)
 
-            self._recent.append({"transition_id": transition_id, "trigger": trigger, "from": prev, "to": dest})
+            self._recent.append(RecentTxn(transition_id, trigger, prev, dest))
 
             self._fire_event(EVENT_TRANSITION_SUCCEEDED, {
                 "transition_id": transition_id,
@@ -181,9 +263,10 @@ class FSMEntity(RestoreEntity):
                 return False
             prev = self._state
             self._state = state
-            self.async_write_ha_state()
+            if state != prev:
+                self.async_write_ha_state()
             self._cancel_timeout()
-            self._recent.append({"trigger": "set_state", "from": prev, "to": state})
+            self._recent.append(RecentTxn(None, "set_state", prev, state))
             return True
 
     async def async_reset(self) -> None:
@@ -191,10 +274,18 @@ class FSMEntity(RestoreEntity):
 
     async def _eval_guard(self, expr: str) -> bool:
         try:
-            tpl = Template(expr, self.hass)
+            tpl = self._guard_templates.get(expr)
+            if tpl is None:
+                from homeassistant.helpers.template import Template
+
+                tpl = self._guard_templates[expr] = Template(expr, self.hass)
             rendered = tpl.async_render(parse_result=False)
-            val = str(rendered).strip().lower()
-            res = val in ("1", "true", "yes", "on")
+            if isinstance(rendered, bool):
+                res = rendered
+            else:
+                if not isinstance(rendered, str):
+                    rendered = str(rendered)
+                res = rendered.strip().lower() in _TRUTHY
             _LOGGER.debug("FSM %s: guard '%s' -> '%s' (%s)",
                           self.entity_id, expr, rendered, res)
             return res
@@ -202,16 +293,9 @@ class FSMEntity(RestoreEntity):
             _LOGGER.warning("FSM %s: guard error for '%s': %s", self.entity_id, expr, e)
             return False
 
-    async def _run_actions(self, actions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    async def _run_actions(self, actions: List[Tuple[str, str, str, Dict[str, Any]]]) -> List[Dict[str, Any]]:
         results: List[Dict[str, Any]] = []
-        for act in actions or []:
-            svc = act.get("service")
-            data = act.get("data", {})
-            if not svc or "." not in svc:
-                _LOGGER.error("FSM %s: bad action service '%s'", self.entity_id, svc)
-                results.append({"service": svc, "ok": False, "error": "bad_service"})
-                continue
-            domain, service = svc.split(".", 1)
+        for svc, domain, service, data in actions:
             try:
                 await self.hass.services.async_call(domain, service, data, blocking=False)
                 results.append({"service": svc, "ok": True})
@@ -221,6 +305,8 @@ class FSMEntity(RestoreEntity):
         return results
 
     def _schedule_timeout(self, seconds: float, dest: str) -> None:
+        from homeassistant.helpers.event import async_call_later
+
         def _cb(_now):
             self.hass.async_create_task(self._timeout_transition(dest))
 
@@ -232,8 +318,9 @@ class FSMEntity(RestoreEntity):
         async with self._lock:
             prev = self._state
             self._state = dest
-            self.async_write_ha_state()
-            self._recent.append({"trigger": "timeout", "from": prev, "to": dest})
+            if dest != prev:
+                self.async_write_ha_state()
+            self._recent.append(RecentTxn(None, "timeout", prev, dest))
             self._timeout_unsub = None
             _LOGGER.debug("FSM %s: timeout fired to '%s'", self.entity_id, dest)
 